@@ -0,0 +1,209 @@
+import csv
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("requests")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import translator  # noqa: E402
+
+
+ENTRIES = [
+    {
+        "timestamp": "2025-11-13 15:32:00",
+        "source_lang": "en",
+        "target_lang": "th",
+        "chars": 20,
+        "source_text": 'page\x0cbreak <b> & "quotes", commas\nnewline',
+        "translated_text": "สวัสดี\x0b ครับ"
+    },
+    {
+        "timestamp": "2025-11-14 09:00:00",
+        "source_lang": "en",
+        "target_lang": "ja",
+        "chars": 5,
+        "source_text": "hello",
+        "translated_text": "こんにちは"
+    },
+]
+
+
+FILTER_ENTRIES = [
+    {"timestamp": "2025-01-04 23:59:59", "source_lang": "en", "target_lang": "th", "source_text": "a"},
+    {"timestamp": "2025-01-05 08:00:00", "source_lang": "en", "target_lang": "th", "source_text": "b"},
+    {"timestamp": "2025-01-10 12:00:00", "source_lang": "en", "target_lang": "ja", "source_text": "c"},
+    {"timestamp": "2025-01-10 13:00:00", "source_lang": "th", "target_lang": "en", "source_text": "d"},
+    {"timestamp": "2025-02-01 09:00:00", "source_lang": "en", "target_lang": "th", "source_text": "e"},
+]
+
+
+def filtered(**kwargs):
+    return [e["source_text"] for e in translator.iter_history_entries(FILTER_ENTRIES, **kwargs)]
+
+
+def test_parse_date_filter_pads_and_validates():
+    assert translator.parse_date_filter(" 2025-1-5 ") == "2025-01-05"
+    with pytest.raises(ValueError):
+        translator.parse_date_filter("2025-13-01")
+
+
+def test_iter_history_entries_filters_by_language_pair():
+    assert filtered() == ["a", "b", "c", "d", "e"]
+    assert filtered(source_lang="en") == ["a", "b", "c", "e"]
+    assert filtered(target_lang="th") == ["a", "b", "e"]
+    assert filtered(source_lang="en", target_lang="ja") == ["c"]
+
+
+def test_iter_history_entries_filters_by_inclusive_dates():
+    date_from = translator.parse_date_filter("2025-1-5")
+    date_to = translator.parse_date_filter("2025-1-10")
+    assert filtered(date_from=date_from) == ["b", "c", "d", "e"]
+    assert filtered(date_to=date_to) == ["a", "b", "c", "d"]
+    assert filtered(date_from=date_from, date_to=date_to, target_lang="th") == ["b"]
+
+
+@pytest.mark.parametrize("ext", ["jsonl", "csv", "tmx"])
+def test_export_import_round_trip(tmp_path, monkeypatch, ext):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    path = str(tmp_path / f"history.{ext}")
+
+    assert translator.export_history(path, ENTRIES) == len(ENTRIES)
+
+    memory = {}
+    total, added, skipped = translator.import_memory(path, memory, threading.Lock())
+    assert (total, added, skipped) == (2, 2, 0)
+
+    for e in ENTRIES:
+        source = e["source_text"]
+        target = e["translated_text"]
+        if ext == "tmx":
+            # control characters XML cannot carry are dropped on export
+            source = translator.INVALID_XML_CHARS.sub("", source)
+            target = translator.INVALID_XML_CHARS.sub("", target)
+        assert memory[(e["source_lang"], e["target_lang"], source)] == target
+
+    assert translator.load_memory() == memory
+
+
+def test_import_skips_bad_records_and_normalizes_langs(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    path = tmp_path / "pairs.jsonl"
+    path.write_text(
+        '{"source_lang": "EN-us", "target_lang": "th_TH", "source_text": "hi", "translated_text": "สวัสดี"}\n'
+        "not json\n"
+        '{"source_lang": "en", "target_lang": "th"}\n'
+        '{"source_lang": "en", "target_lang": "ja", "source_text": "yes", "translated_text": "はい"}\n',
+        encoding="utf-8"
+    )
+
+    memory = {}
+    assert translator.import_memory(str(path), memory, threading.Lock()) == (2, 2, 2)
+    assert memory[("en", "th", "hi")] == "สวัสดี"
+    assert memory[("en", "ja", "yes")] == "はい"
+
+
+def test_import_compacts_superseded_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    monkeypatch.setattr(translator, "MEMORY_COMPACT_MIN_STALE", 3)
+    path = str(tmp_path / "history.jsonl")
+
+    memory = {}
+    lock = threading.Lock()
+    for version in range(3):
+        entries = [dict(e, translated_text=f"{e['translated_text']} v{version}") for e in ENTRIES]
+        translator.export_history(path, entries)
+        translator.import_memory(path, memory, lock)
+
+    assert translator.count_memory_lines() == len(memory) == 2
+    assert translator.load_memory() == memory
+    assert memory[("en", "ja", "hello")] == "こんにちは v2"
+
+
+def test_normalize_lang_code_keeps_distinct_variants():
+    assert translator.normalize_lang_code("EN-us") == "en"
+    assert translator.normalize_lang_code("th_TH") == "th"
+    assert translator.normalize_lang_code("zh-CN") == "zh"
+    assert translator.normalize_lang_code("zh-Hans") == "zh"
+    assert translator.normalize_lang_code("zh-TW") == "zh-tw"
+    assert translator.normalize_lang_code("zh-Hant") == "zh-hant"
+    assert translator.normalize_lang_code("pt-BR") == "pt-br"
+
+
+def test_tmx_chinese_variants_do_not_overwrite(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    path = tmp_path / "zh.tmx"
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<tmx version="1.4"><header srclang="en-US"/><body>\n'
+        '<tu><tuv xml:lang="en-US"><seg>hello</seg></tuv>'
+        '<tuv xml:lang="zh-CN"><seg>你好</seg></tuv>'
+        '<tuv xml:lang="zh-TW"><seg>妳好</seg></tuv></tu>\n'
+        '<tu><tuv xml:lang="en-US"><seg>hi</seg></tuv>'
+        '<tuv xml:lang="th"><seg>หวัดดี</seg></tuv></tu>\n'
+        '<tu><tuv xml:lang="en-GB"><seg>hi</seg></tuv>'
+        '<tuv xml:lang="th-TH"><seg>หวัดดี</seg></tuv></tu>\n'
+        '</body></tmx>\n',
+        encoding="utf-8"
+    )
+
+    memory = {}
+    assert translator.import_memory(str(path), memory, threading.Lock()) == (4, 3, 0)
+    assert memory[("en", "zh", "hello")] == "你好"
+    assert memory[("en", "zh-tw", "hello")] == "妳好"
+
+
+def test_compaction_keeps_lines_appended_while_rewriting(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    monkeypatch.setattr(translator, "MEMORY_COMPACT_MIN_STALE", 1)
+
+    memory = {}
+    lock = threading.Lock()
+    translator.append_memory(memory, [("en", "th", "hi", "v1")])
+    translator.append_memory(memory, [("en", "th", "hi", "v2")])
+
+    # simulate a translation saved while the snapshot is being written
+    real_memory_line = translator.memory_line
+
+    def memory_line(key, t_text):
+        if not memory.get(("en", "ja", "yes")):
+            assert not lock.locked()
+            translator.append_memory(memory, [("en", "ja", "yes", "はい")])
+        return real_memory_line(key, t_text)
+
+    monkeypatch.setattr(translator, "memory_line", memory_line)
+    assert translator.compact_memory_if_needed(memory, lock)
+    monkeypatch.setattr(translator, "memory_line", real_memory_line)
+
+    assert translator.load_memory() == {("en", "th", "hi"): "v2", ("en", "ja", "yes"): "はい"}
+    assert translator.count_memory_lines() == 2
+
+
+def test_csv_import_handles_long_fields(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    path = str(tmp_path / "long.csv")
+    long_text = "x" * 200000
+    translator.export_history(path, [dict(ENTRIES[1], source_text=long_text)])
+
+    memory = {}
+    assert translator.import_memory(path, memory, threading.Lock()) == (1, 1, 0)
+    assert memory[("en", "ja", long_text)] == "こんにちは"
+
+
+def test_csv_import_skips_unreadable_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "MEMORY_PATH", str(tmp_path / "memory.jsonl"))
+    # a tiny limit makes the long row raise csv.Error
+    monkeypatch.setattr(translator, "CSV_FIELD_SIZE_LIMIT", 50)
+    path = str(tmp_path / "rows.csv")
+    translator.export_history(path, [ENTRIES[1], dict(ENTRIES[1], source_text="y" * 100), ENTRIES[1]])
+
+    old_limit = csv.field_size_limit()
+    try:
+        memory = {}
+        assert translator.import_memory(path, memory, threading.Lock()) == (2, 1, 1)
+    finally:
+        csv.field_size_limit(old_limit)
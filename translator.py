@@ -1,7 +1,12 @@
 import os
 import sys
+import csv
 import json
 import datetime
+import re
+import threading
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
 import requests
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
@@ -25,6 +30,7 @@ BASE_DIR = get_base_dir()
 CONFIG_PATH = os.path.join(BASE_DIR, "config.json")
 USAGE_PATH = os.path.join(BASE_DIR, "usage.json")
 HISTORY_PATH = os.path.join(BASE_DIR, "history.json")
+MEMORY_PATH = os.path.join(BASE_DIR, "memory.jsonl")
 
 
 def load_config():
@@ -45,6 +51,9 @@ def load_config():
     if "monthly_limit" not in cfg:
         cfg["monthly_limit"] = 500000
 
+    if "use_memory" not in cfg:
+        cfg["use_memory"] = True
+
     return cfg
 
 
@@ -98,7 +107,8 @@ def load_history():
           "target_lang": "th",
           "chars": 123,
           "source_text": "...",
-          "translated_text": "..."
+          "translated_text": "...",
+          "from_memory": true      (optional, set when served from memory.jsonl)
         }
       ]
     }
@@ -121,6 +131,124 @@ def save_history(data):
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+# json.dumps() builds a new encoder per call when given options; reuse one for bulk writes
+MEMORY_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# memory.jsonl is rewritten once superseded lines reach this many (or half the live pairs, if more)
+MEMORY_COMPACT_MIN_STALE = 1000
+
+
+def load_memory():
+    """
+    memory.jsonl is the local translation memory, one pair per line:
+    {"source_lang": "en", "target_lang": "th", "source_text": "...", "translated_text": "..."}
+
+    The file is append-only; when a pair appears more than once the last line wins.
+    Returns a dict keyed by (source_lang, target_lang, source_text).
+    """
+    memory = {}
+    if not os.path.exists(MEMORY_PATH):
+        return memory
+
+    with open(MEMORY_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+                key = (rec["source_lang"], rec["target_lang"], rec["source_text"])
+                memory[key] = rec["translated_text"]
+            except (ValueError, KeyError, TypeError):
+                # skip broken lines instead of refusing to start
+                continue
+    return memory
+
+
+def append_memory(memory, pairs):
+    """
+    Add (source_lang, target_lang, source_text, translated_text) pairs to the
+    in-memory dict and append the new / changed ones to memory.jsonl.
+    Within one call the last pair for a key wins.
+    Returns the list of keys written.
+    """
+    pending = {}
+    for sl, tl, s_text, t_text in pairs:
+        pending[(sl, tl, s_text)] = t_text
+
+    written = []
+    lines = []
+    for key, t_text in pending.items():
+        if memory.get(key) == t_text:
+            continue
+        memory[key] = t_text
+        written.append(key)
+        lines.append(memory_line(key, t_text))
+
+    if lines:
+        with open(MEMORY_PATH, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+    return written
+
+
+def memory_line(key, translated_text):
+    sl, tl, s_text = key
+    rec = {
+        "source_lang": sl,
+        "target_lang": tl,
+        "source_text": s_text,
+        "translated_text": translated_text
+    }
+    return MEMORY_ENCODER.encode(rec) + "\n"
+
+
+def count_memory_lines():
+    if not os.path.exists(MEMORY_PATH):
+        return 0
+    count = 0
+    with open(MEMORY_PATH, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count
+
+
+def compact_memory_if_needed(memory, lock):
+    """
+    Rewrite memory.jsonl with one line per pair once enough lines have been
+    superseded by later ones. Returns True when the file was rewritten.
+
+    The lock is only held to snapshot the pairs and to swap the file in; lines
+    appended while the snapshot is written are carried over before the swap.
+    """
+    with lock:
+        live = len(memory)
+    stale = count_memory_lines() - live
+    if stale < max(MEMORY_COMPACT_MIN_STALE, live // 2):
+        return False
+
+    with lock:
+        if not os.path.exists(MEMORY_PATH):
+            return False
+        snapshot = list(memory.items())
+        offset = os.path.getsize(MEMORY_PATH)
+
+    tmp_path = MEMORY_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(memory_line(key, t_text) for key, t_text in snapshot)
+    del snapshot
+
+    with lock:
+        if not os.path.exists(MEMORY_PATH):
+            # memory was cleared meanwhile
+            os.remove(tmp_path)
+            return False
+        with open(MEMORY_PATH, "rb") as src, open(tmp_path, "ab") as dst:
+            src.seek(offset)
+            dst.write(src.read())
+        os.replace(tmp_path, MEMORY_PATH)
+    return True
+
+
 # -------------------------------
 # Languages & display helpers
 # -------------------------------
@@ -221,10 +349,373 @@ def google_translate(api_key, text, source_lang, target_lang):
     return translations[0].get("translatedText", "")
 
 
+# -------------------------------
+# History export / import
+# -------------------------------
+
+EXPORT_FORMATS = {
+    ".jsonl": "jsonl",
+    ".csv": "csv",
+    ".tmx": "tmx",
+}
+
+CSV_FIELDS = ["timestamp", "source_lang", "target_lang", "chars", "source_text", "translated_text"]
+
+# Largest value csv.field_size_limit() accepts on every platform (C long on Windows)
+CSV_FIELD_SIZE_LIMIT = 2**31 - 1
+
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# Characters XML 1.0 does not allow at all (control chars like form feed, lone surrogates)
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+# Pairs are handed to append_memory in batches so imports stay in bounded memory
+IMPORT_BATCH_SIZE = 5000
+
+
+def get_file_format(path):
+    fmt = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError("Unsupported file type. Use .jsonl, .csv or .tmx")
+    return fmt
+
+
+# Google's "zh" is Simplified Chinese; only these variants may be stored as "zh"
+ZH_SIMPLIFIED_TAGS = {"zh-cn", "zh-sg", "zh-hans", "zh-hans-cn", "zh-hans-sg"}
+
+
+def normalize_lang_code(code):
+    """
+    Map a language tag onto the app's codes where it means the same thing,
+    e.g. "en-US" / "en_us" → "en", "zh-Hans" → "zh".
+    Other variants (e.g. "zh-TW") keep their own lower-case tag so they never
+    overwrite pairs for the code the app requests.
+    """
+    code = code.strip().replace("_", "-").lower()
+    base = code.split("-")[0]
+    if base not in LANG_CODES or code == base:
+        return code
+    if base == "zh":
+        return base if code in ZH_SIMPLIFIED_TAGS else code
+    return base
+
+
+def parse_date_filter(text):
+    """
+    Validate a "YYYY-MM-DD" filter date and return it zero-padded ("2025-1-5" → "2025-01-05"),
+    so it compares correctly against history timestamps. Raises ValueError if invalid.
+    """
+    return datetime.datetime.strptime(text.strip(), "%Y-%m-%d").strftime("%Y-%m-%d")
+
+
+def iter_history_entries(entries, source_lang=None, target_lang=None, date_from=None, date_to=None):
+    """
+    Lazily filter history entries by language pair and date.
+    date_from / date_to are inclusive "YYYY-MM-DD" strings; None means no limit.
+    """
+    for e in entries:
+        if source_lang and e.get("source_lang") != source_lang:
+            continue
+        if target_lang and e.get("target_lang") != target_lang:
+            continue
+        day = e.get("timestamp", "")[:10]
+        if date_from and day < date_from:
+            continue
+        if date_to and day > date_to:
+            continue
+        yield e
+
+
+def write_history_jsonl(f, entries):
+    count = 0
+    for e in entries:
+        f.write(MEMORY_ENCODER.encode(e) + "\n")
+        count += 1
+    return count
+
+
+def write_history_csv(f, entries):
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for e in entries:
+        writer.writerow(e)
+        count += 1
+    return count
+
+
+def tmx_date(timestamp):
+    # history timestamps are local time, TMX wants UTC "YYYYMMDDThhmmssZ"
+    try:
+        dt = datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        return dt.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    except Exception:
+        return None
+
+
+def xml_text(text):
+    return escape(INVALID_XML_CHARS.sub("", text))
+
+
+def xml_attr(text):
+    return quoteattr(INVALID_XML_CHARS.sub("", text))
+
+
+def write_history_tmx(f, entries):
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write('<tmx version="1.4">\n')
+    f.write(
+        '  <header creationtool="CloudTranslate for Windows" creationtoolversion="1.0" '
+        'datatype="plaintext" segtype="block" adminlang="en" srclang="*all*" o-tmf="history.json"/>\n'
+    )
+    f.write("  <body>\n")
+    count = 0
+    for e in entries:
+        sl = e.get("source_lang", "")
+        tl = e.get("target_lang", "")
+        created = tmx_date(e.get("timestamp", ""))
+        date_attr = f" creationdate={xml_attr(created)}" if created else ""
+        f.write(f"    <tu srclang={xml_attr(sl)}{date_attr}>\n")
+        f.write(f"      <tuv xml:lang={xml_attr(sl)}><seg>{xml_text(e.get('source_text', ''))}</seg></tuv>\n")
+        f.write(f"      <tuv xml:lang={xml_attr(tl)}><seg>{xml_text(e.get('translated_text', ''))}</seg></tuv>\n")
+        f.write("    </tu>\n")
+        count += 1
+    f.write("  </body>\n")
+    f.write("</tmx>\n")
+    return count
+
+
+def export_history(path, entries):
+    """
+    Stream entries to path; format is picked from the file extension.
+    Returns the number of entries written.
+    """
+    fmt = get_file_format(path)
+    if fmt == "csv":
+        # utf-8-sig so Excel on Windows detects the encoding
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            return write_history_csv(f, entries)
+    with open(path, "w", encoding="utf-8") as f:
+        if fmt == "tmx":
+            return write_history_tmx(f, entries)
+        return write_history_jsonl(f, entries)
+
+
+# Importers yield (source_lang, target_lang, source_text, translated_text),
+# or None for a record that can't be read so the caller can count it as skipped.
+
+def iter_jsonl_pairs(path):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                e = json.loads(line)
+                yield e["source_lang"], e["target_lang"], e["source_text"], e["translated_text"]
+            except (ValueError, KeyError, TypeError):
+                yield None
+
+
+def iter_csv_pairs(path):
+    # history entries can be far longer than csv's default 128 KiB field limit
+    csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error:
+                yield None
+                continue
+            # missing columns come back as None and are skipped by import_memory
+            yield row.get("source_lang"), row.get("target_lang"), row.get("source_text"), row.get("translated_text")
+
+
+def iter_tmx_pairs(path):
+    """
+    Yield one pair per source/target variant of every <tu>.
+    The source is the tu (or header) srclang, or the first <tuv> when it is "*all*".
+    """
+    header_srclang = None
+    parents = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+
+        if elem.tag == "header":
+            header_srclang = elem.get("srclang")
+            continue
+        if elem.tag != "tu":
+            continue
+
+        variants = []
+        for tuv in elem.iter("tuv"):
+            lang = tuv.get(XML_LANG) or tuv.get("lang")
+            seg = tuv.find("seg")
+            if lang and seg is not None:
+                variants.append((normalize_lang_code(lang), "".join(seg.itertext())))
+
+        srclang = elem.get("srclang") or header_srclang
+        if srclang and srclang != "*all*":
+            srclang = normalize_lang_code(srclang)
+        elif variants:
+            srclang = variants[0][0]
+
+        source = next((v for v in variants if v[0] == srclang), None)
+        targets = [v for v in variants if v[0] != srclang]
+        if source is None or not targets:
+            yield None
+        else:
+            for lang, text in targets:
+                yield srclang, lang, source[1], text
+
+        # detach the parsed unit so large files don't build a full tree
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+
+def iter_import_pairs(path):
+    fmt = get_file_format(path)
+    if fmt == "csv":
+        return iter_csv_pairs(path)
+    if fmt == "tmx":
+        return iter_tmx_pairs(path)
+    return iter_jsonl_pairs(path)
+
+
+def import_memory(path, memory, lock):
+    """
+    Stream pairs from path into the translation memory in batches.
+    The lock is only held while a batch is applied, so the UI can keep using memory.
+    Malformed or incomplete records are skipped rather than aborting the import.
+    Returns (pairs read, distinct pairs new or changed in memory, records skipped).
+    """
+    total = 0
+    added = set()
+    skipped = 0
+    batch = []
+    for pair in iter_import_pairs(path):
+        if pair is None or not all(isinstance(v, str) and v for v in pair):
+            skipped += 1
+            continue
+        sl, tl, s_text, t_text = pair
+        batch.append((normalize_lang_code(sl), normalize_lang_code(tl), s_text, t_text))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            with lock:
+                added.update(append_memory(memory, batch))
+            total += len(batch)
+            batch = []
+    if batch:
+        with lock:
+            added.update(append_memory(memory, batch))
+        total += len(batch)
+
+    compact_memory_if_needed(memory, lock)
+    return total, len(added), skipped
+
+
 # -------------------------------
 # App UI (CustomTkinter)
 # -------------------------------
 
+class HistoryExportDialog(ctk.CTkToplevel):
+    """
+    Modal dialog asking for the export filter.
+    After wait_window(), self.result is None (cancelled) or a dict of
+    source_lang / target_lang / date_from / date_to (None = no filter).
+    """
+
+    ANY = "Any"
+
+    def __init__(self, parent, lang_display_list):
+        super().__init__(parent)
+        self.result = None
+
+        self.title("Export history")
+        self.resizable(False, False)
+        self.transient(parent)
+
+        values = [self.ANY] + [v for v in lang_display_list if not is_separator_item(v)]
+
+        ctk.CTkLabel(self, text="From:").grid(row=0, column=0, padx=(10, 5), pady=5, sticky="w")
+        self.from_combo = ctk.CTkComboBox(self, values=values, width=200)
+        self.from_combo.set(self.ANY)
+        self.from_combo.grid(row=0, column=1, padx=(5, 10), pady=5)
+
+        ctk.CTkLabel(self, text="To:").grid(row=1, column=0, padx=(10, 5), pady=5, sticky="w")
+        self.to_combo = ctk.CTkComboBox(self, values=values, width=200)
+        self.to_combo.set(self.ANY)
+        self.to_combo.grid(row=1, column=1, padx=(5, 10), pady=5)
+
+        ctk.CTkLabel(self, text="Date from:").grid(row=2, column=0, padx=(10, 5), pady=5, sticky="w")
+        self.date_from_entry = ctk.CTkEntry(self, width=200, placeholder_text="YYYY-MM-DD (optional)")
+        self.date_from_entry.grid(row=2, column=1, padx=(5, 10), pady=5)
+
+        ctk.CTkLabel(self, text="Date to:").grid(row=3, column=0, padx=(10, 5), pady=5, sticky="w")
+        self.date_to_entry = ctk.CTkEntry(self, width=200, placeholder_text="YYYY-MM-DD (optional)")
+        self.date_to_entry.grid(row=3, column=1, padx=(5, 10), pady=5)
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.grid(row=4, column=0, columnspan=2, pady=(5, 10))
+
+        ok_btn = ctk.CTkButton(
+            btn_frame,
+            text="Export",
+            width=100,
+            fg_color="black",
+            hover_color="#222222",
+            text_color="white",
+            command=self.on_ok
+        )
+        ok_btn.grid(row=0, column=0, padx=5)
+
+        cancel_btn = ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            width=100,
+            fg_color="black",
+            hover_color="#222222",
+            text_color="white",
+            command=self.destroy
+        )
+        cancel_btn.grid(row=0, column=1, padx=5)
+
+        self.after(100, self.grab_set)
+
+    def read_date(self, entry, label):
+        text = entry.get().strip()
+        if not text:
+            return None
+        try:
+            return parse_date_filter(text)
+        except ValueError:
+            messagebox.showerror("Invalid date", f"{label} must be in YYYY-MM-DD format.", parent=self)
+            raise
+
+    def on_ok(self):
+        try:
+            date_from = self.read_date(self.date_from_entry, "Date from")
+            date_to = self.read_date(self.date_to_entry, "Date to")
+        except ValueError:
+            return
+
+        from_val = self.from_combo.get()
+        to_val = self.to_combo.get()
+        self.result = {
+            "source_lang": None if from_val == self.ANY else parse_lang(from_val),
+            "target_lang": None if to_val == self.ANY else parse_lang(to_val),
+            "date_from": date_from,
+            "date_to": date_to
+        }
+        self.destroy()
+
+
 class TranslatorApp(ctk.CTk):
 
     def __init__(self, config):
@@ -234,6 +725,10 @@ class TranslatorApp(ctk.CTk):
         self.api_key = config["google_api_key"]
         self.usage_data = load_usage(config["monthly_limit"])
         self.history_data = load_history()
+        # filled in the background by load_memory_async()
+        self.memory_data = {}
+        self.memory_lock = threading.Lock()
+        self.memory_ready = False
 
         self.title("CloudTranslate for Windows")
         self.geometry("900x600")
@@ -256,6 +751,7 @@ class TranslatorApp(ctk.CTk):
         self.update_char_count()
         self.update_usage_labels()
         self.load_history_to_ui()
+        self.load_memory_async()
 
     def create_widgets(self):
         # ===== Top frame: language selection + swap =====
@@ -395,6 +891,19 @@ class TranslatorApp(ctk.CTk):
         )
         self.translate_btn.grid(row=0, column=0, pady=5, sticky="n")
 
+        # Unticking forces a fresh API translation, which then replaces the memory entry
+        self.use_memory_var = ctk.BooleanVar(value=bool(self.config_data.get("use_memory", True)))
+        use_memory_check = ctk.CTkCheckBox(
+            translate_frame,
+            text="Use translation memory",
+            variable=self.use_memory_var,
+            font=ctk.CTkFont(size=11)
+        )
+        use_memory_check.grid(row=0, column=1, padx=(10, 0), pady=5)
+
+        self.memory_status_label = ctk.CTkLabel(translate_frame, text="", font=ctk.CTkFont(size=10))
+        self.memory_status_label.grid(row=1, column=0, columnspan=2)
+
         # ===== Bottom frame: usage + history =====
         bottom_frame = ctk.CTkFrame(self)
         bottom_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
@@ -415,12 +924,49 @@ class TranslatorApp(ctk.CTk):
         )
         self.reset_label.grid(row=0, column=0, padx=10, pady=(5, 0), sticky="e")
 
+        history_header = ctk.CTkFrame(bottom_frame, fg_color="transparent")
+        history_header.grid(row=1, column=0, padx=10, pady=(5, 0), sticky="ew")
+        history_header.grid_columnconfigure(0, weight=1)
+
         history_label = ctk.CTkLabel(
-            bottom_frame,
+            history_header,
             text="History (latest first)",
             font=ctk.CTkFont(size=11, weight="bold")
         )
-        history_label.grid(row=1, column=0, padx=10, pady=(5, 0), sticky="w")
+        history_label.grid(row=0, column=0, sticky="w")
+
+        self.export_history_btn = ctk.CTkButton(
+            history_header,
+            text="Export history",
+            width=110,
+            fg_color="black",
+            hover_color="#222222",
+            text_color="white",
+            command=self.export_history_file
+        )
+        self.export_history_btn.grid(row=0, column=1, padx=5)
+
+        self.import_memory_btn = ctk.CTkButton(
+            history_header,
+            text="Import",
+            width=80,
+            fg_color="black",
+            hover_color="#222222",
+            text_color="white",
+            command=self.import_memory_file
+        )
+        self.import_memory_btn.grid(row=0, column=2, padx=5)
+
+        self.clear_memory_btn = ctk.CTkButton(
+            history_header,
+            text="Clear memory",
+            width=110,
+            fg_color="black",
+            hover_color="#222222",
+            text_color="white",
+            command=self.clear_memory
+        )
+        self.clear_memory_btn.grid(row=0, column=3, padx=(5, 0))
 
         self.history_box = ctk.CTkTextbox(bottom_frame, height=120)
         self.history_box.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="nsew")
@@ -519,6 +1065,122 @@ class TranslatorApp(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Error", f"Could not save file:\n{e}")
 
+    def export_history_file(self):
+        dialog = HistoryExportDialog(self, self.lang_display_list)
+        self.wait_window(dialog)
+        if dialog.result is None:
+            return
+
+        path = filedialog.asksaveasfilename(
+            defaultextension=".jsonl",
+            filetypes=[
+                ("JSON Lines", "*.jsonl"),
+                ("CSV files", "*.csv"),
+                ("TMX translation memory", "*.tmx")
+            ]
+        )
+        if not path:
+            return
+
+        # snapshot the list so the worker is not affected by new translations
+        entries = iter_history_entries(list(self.history_data.get("entries", [])), **dialog.result)
+        self.export_history_btn.configure(state="disabled", text="Exporting...")
+
+        def worker():
+            try:
+                count = export_history(path, entries)
+                self.after(0, lambda: self.on_export_done(path, count, None))
+            except Exception as e:
+                self.after(0, lambda err=e: self.on_export_done(path, 0, err))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_export_done(self, path, count, error):
+        self.export_history_btn.configure(state="normal", text="Export history")
+        if error is not None:
+            messagebox.showerror("Error", f"Could not export history:\n{error}")
+            return
+        messagebox.showinfo("Exported", f"{count:,} history entries saved to:\n{path}")
+
+    def load_memory_async(self):
+        def worker():
+            loaded = load_memory()
+            with self.memory_lock:
+                # pairs saved during this session are newer than the file contents
+                for key, value in loaded.items():
+                    self.memory_data.setdefault(key, value)
+            compact_memory_if_needed(self.memory_data, self.memory_lock)
+            self.after(0, self.on_memory_loaded)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_memory_loaded(self):
+        self.memory_ready = True
+
+    def memory_loading_warning(self):
+        if self.memory_ready:
+            return False
+        messagebox.showinfo("Please wait", "The translation memory is still loading. Try again in a moment.")
+        return True
+
+    def import_memory_file(self):
+        if self.memory_loading_warning():
+            return
+
+        path = filedialog.askopenfilename(
+            filetypes=[
+                ("Translation files", "*.jsonl *.csv *.tmx"),
+                ("JSON Lines", "*.jsonl"),
+                ("CSV files", "*.csv"),
+                ("TMX translation memory", "*.tmx")
+            ]
+        )
+        if not path:
+            return
+
+        self.import_memory_btn.configure(state="disabled", text="Importing...")
+        # clearing between batches would leave a half-imported memory
+        self.clear_memory_btn.configure(state="disabled")
+
+        def worker():
+            try:
+                total, added, skipped = import_memory(path, self.memory_data, self.memory_lock)
+                self.after(0, lambda: self.on_import_done(path, total, added, skipped, None))
+            except Exception as e:
+                self.after(0, lambda err=e: self.on_import_done(path, 0, 0, 0, err))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_import_done(self, path, total, added, skipped, error):
+        self.import_memory_btn.configure(state="normal", text="Import")
+        self.clear_memory_btn.configure(state="normal")
+        if error is not None:
+            messagebox.showerror("Error", f"Could not import file:\n{error}")
+            return
+        messagebox.showinfo(
+            "Imported",
+            f"Read {total:,} translation pairs from:\n{path}\n\n"
+            f"New or updated in translation memory: {added:,}\n"
+            f"Skipped (malformed or incomplete): {skipped:,}"
+        )
+
+    def clear_memory(self):
+        if self.memory_loading_warning():
+            return
+
+        with self.memory_lock:
+            count = len(self.memory_data)
+        if not messagebox.askyesno(
+            "Clear memory",
+            f"Delete all {count:,} pairs from the translation memory?\nHistory is not affected."
+        ):
+            return
+        with self.memory_lock:
+            self.memory_data.clear()
+            if os.path.exists(MEMORY_PATH):
+                os.remove(MEMORY_PATH)
+        self.memory_status_label.configure(text="")
+
     def clear_texts(self):
         self.input_text.delete("1.0", "end")
         self.output_text.delete("1.0", "end")
@@ -564,7 +1226,9 @@ class TranslatorApp(ctk.CTk):
             short_source = (s_text[:60] + "...") if len(s_text) > 60 else s_text
             short_target = (t_text[:60] + "...") if len(t_text) > 60 else t_text
 
-            line = f"[{time_str}] {sl}->{tl} ({chars} chars)\n  {short_source}\n  → {short_target}\n"
+            source_note = ", from memory" if e.get("from_memory") else ""
+
+            line = f"[{time_str}] {sl}->{tl} ({chars} chars{source_note})\n  {short_source}\n  → {short_target}\n"
             self.history_box.insert("end", line)
 
         self.history_box.configure(state="disabled")
@@ -590,6 +1254,31 @@ class TranslatorApp(ctk.CTk):
         char_count = len(text)
         self.update_char_count()
 
+        self.memory_status_label.configure(text="")
+
+        # Translation memory hit: no API call and no usage charged
+        cached = None
+        if self.use_memory_var.get():
+            with self.memory_lock:
+                cached = self.memory_data.get((source_lang, target_lang, text))
+        if cached is not None:
+            self.output_text.configure(state="normal")
+            self.output_text.delete("1.0", "end")
+            self.output_text.insert("1.0", cached)
+            self.memory_status_label.configure(
+                text="From translation memory (no API call). Untick \"Use translation memory\" to re-translate."
+            )
+            self.append_history_entry({
+                "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "source_lang": source_lang,
+                "target_lang": target_lang,
+                "chars": char_count,
+                "source_text": text,
+                "translated_text": cached,
+                "from_memory": True
+            })
+            return
+
         limit_heavy = 5000
         if char_count >= limit_heavy:
             if not messagebox.askyesno(
@@ -633,6 +1322,9 @@ class TranslatorApp(ctk.CTk):
         save_usage(self.usage_data)
         self.update_usage_labels()
 
+        with self.memory_lock:
+            append_memory(self.memory_data, [(source_lang, target_lang, text, translated)])
+
         entry = {
             "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "source_lang": source_lang,